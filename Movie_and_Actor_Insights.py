@@ -6,18 +6,88 @@ It includes visualizations for movie types, actor counts, and actor height distr
 """
 
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
-from movie_dataset import MovieDataset
-
-# Initialize the MovieDataset instance
-test_instance = MovieDataset()
+from matplotlib.figure import Figure
+import plotly.graph_objects as go
+from movie_dataset import height_density
+from data import get_dataset, movie_type_cached, actor_count_cached
 
 # Set Streamlit page configuration
 st.set_page_config(page_title="Movie & Actor Insights", page_icon="🎬", layout="wide")
 
+# Initialize the MovieDataset instance
+test_instance = get_dataset()
+
 st.title("Movie Dataset Analysis")
 
+@st.cache_data
+def gender_options():
+    """
+    Returns the gender dropdown options, built once from the character metadata.
+    """
+    return ["All"] + sorted(test_instance.character_metadata["actor_gender"].dropna().unique().tolist())
+
+@st.cache_resource
+def build_movie_type_fig(n):
+    """
+    Builds the top N movie types bar chart once per N.
+    """
+    movie_type_df = movie_type_cached(test_instance, n)
+    fig = go.Figure(go.Bar(
+        x=movie_type_df["Movie_Type"].to_numpy(), y=movie_type_df["Count"].to_numpy(),
+        marker={"color": "skyblue", "line": {"color": "black", "width": 1}}
+    ))
+    fig.update_layout(
+        title="Top Movie Types", xaxis_title="Movie Type", yaxis_title="Count", xaxis_tickangle=-45
+    )
+    return fig
+
+@st.cache_resource
+def build_actor_count_fig():
+    """
+    Builds the actors-per-movie bar chart once.
+    """
+    actor_count_df = actor_count_cached(test_instance)
+    fig = go.Figure(go.Bar(
+        x=actor_count_df["Number_of_Actors"].to_numpy(), y=actor_count_df["Movie_Count"].to_numpy(),
+        marker={"color": "lightcoral", "line": {"color": "black", "width": 1}}
+    ))
+    fig.update_layout(
+        title="Movies by Number of Actors", xaxis_title="Number of Actors", yaxis_title="Movie Count"
+    )
+    return fig
+
+# Number of height ranges whose density curve is kept; each entry is two 1024-point arrays
+MAX_CACHED_DENSITIES = 256
+
+@st.cache_data(max_entries=MAX_CACHED_DENSITIES)
+def cached_height_density(gender, max_height, min_height):
+    """
+    Returns the actor height density curve for a gender and height range, or None.
+    """
+    actor_dist_df = test_instance.actor_distributions(gender, max_height, min_height, plot=False)
+    return height_density(actor_dist_df["actor_height"].to_numpy(), min_height, max_height)
+
+def build_height_fig(gender, max_height, min_height):
+    """
+    Builds the actor height density plot from the cached curve.
+
+    A new Figure is built on every run: figures are not thread-safe, so they are not
+    shared between sessions.
+    """
+    density = cached_height_density(gender, max_height, min_height)
+    fig = Figure()
+    ax = fig.subplots()
+    # Leave the axes empty when there are too few distinct heights for a density
+    if density is not None:
+        x, y = density
+        ax.fill_between(x, 0, y, alpha=0.55, color="blue")
+        ax.plot(x, y, color="blue", lw=2)
+    ax.set_ylabel("Density")
+    ax.set_xlabel("Actor Height (m)")
+    ax.set_title("Actor Height Distribution")
+    return fig
+
+@st.fragment
 def plot_movie_type_histogram():
     """
     Plots a histogram of the top N movie types.
@@ -28,17 +98,9 @@ def plot_movie_type_histogram():
     n = st.number_input(
         "Select N (Top N Movie Types):", min_value=1, max_value=50, value=10, step=1
     )
-    movie_type_df = test_instance.movie_type(n)
-    fig, ax = plt.subplots()
-    ax.bar(
-        movie_type_df["Movie_Type"], movie_type_df["Count"], color="skyblue", edgecolor="black"
-    )
-    ax.set_xlabel("Movie Type")
-    ax.set_ylabel("Count")
-    ax.set_title("Top Movie Types")
-    plt.xticks(rotation=45, ha='right')
-    st.pyplot(fig)
+    st.plotly_chart(build_movie_type_fig(n))
 
+@st.fragment
 def plot_actor_count_histogram():
     """
     Plots a histogram of the number of actors per movie.
@@ -46,17 +108,9 @@ def plot_actor_count_histogram():
     Displays the distribution of movies based on the number of actors.
     """
     st.header("Actor Count Histogram")
-    actor_count_df = test_instance.actor_count()
-    fig, ax = plt.subplots()
-    ax.bar(
-        actor_count_df["Number_of_Actors"], actor_count_df["Movie_Count"], color="lightcoral",
-        edgecolor="black"
-    )
-    ax.set_xlabel("Number of Actors")
-    ax.set_ylabel("Movie Count")
-    ax.set_title("Movies by Number of Actors")
-    st.pyplot(fig)
+    st.plotly_chart(build_actor_count_fig())
 
+@st.fragment
 def plot_actor_height_distribution():
     """
     Plots the height distribution of actors based on selected gender and height range.
@@ -64,9 +118,7 @@ def plot_actor_height_distribution():
     Allows the user to filter by gender and specify minimum and maximum heights.
     """
     st.header("Actor Height Distribution")
-    gender = st.selectbox(
-        "Select Gender:", ["All"] + list(test_instance.character_metadata["actor_gender"].dropna().unique())
-    )
+    gender = st.selectbox("Select Gender:", gender_options())
     col1, col2 = st.columns(2)
     with col1:
         min_height = st.number_input(
@@ -77,13 +129,7 @@ def plot_actor_height_distribution():
             "Maximum Height (m):", min_value=1.0, max_value=2.5, value=2.0, step=0.01
         )
 
-    actor_dist_df = test_instance.actor_distributions(gender, max_height, min_height, plot=False)
-    fig, ax = plt.subplots()
-    sns.kdeplot(actor_dist_df["actor_height"], ax=ax, color="blue", fill=True)
-    ax.set_ylabel("Density")
-    ax.set_xlabel("Actor Height (m)")
-    ax.set_title("Actor Height Distribution")
-    st.pyplot(fig)
+    st.pyplot(build_height_fig(gender, max_height, min_height))
 
 # Plot the visualizations
 plot_movie_type_histogram()
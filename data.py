@@ -0,0 +1,56 @@
+"""
+Shared data access for the Streamlit pages.
+
+Every page obtains the dataset through get_dataset(), so a single MovieDataset
+instance is created per server process and shared across pages, reruns and sessions.
+"""
+
+import streamlit as st
+from movie_dataset import MovieDataset
+
+
+@st.cache_resource
+def get_dataset() -> MovieDataset:
+    """
+    Creates the MovieDataset once and shares it across pages, reruns and sessions.
+
+    Returns:
+        MovieDataset: The loaded dataset.
+    """
+    return MovieDataset()
+
+
+# The analysis methods are pure functions of the loaded dataframes and their small
+# arguments, so their results are cached per argument. The leading underscore keeps
+# Streamlit from hashing the dataset itself.
+
+@st.cache_data
+def movie_type_cached(_ds: MovieDataset, top_n: int):
+    """
+    Returns the top N movie types, recomputed only when N changes.
+    """
+    return _ds.movie_type(top_n)
+
+
+@st.cache_data
+def actor_count_cached(_ds: MovieDataset):
+    """
+    Returns the actors-per-movie histogram, computed once.
+    """
+    return _ds.actor_count()
+
+
+@st.cache_data
+def releases_cached(_ds: MovieDataset, genre):
+    """
+    Returns the releases per year, recomputed only when the genre changes.
+    """
+    return _ds.releases(genre)
+
+
+@st.cache_data
+def ages_cached(_ds: MovieDataset, mode: str):
+    """
+    Returns the actor births per year or month, recomputed only when the mode changes.
+    """
+    return _ds.ages(mode)
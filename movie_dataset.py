@@ -2,40 +2,248 @@
 Module for handling downloading, extracting, and loading the CMU Movie Dataset.
 """
 
+import contextlib
+import functools
+import json
+import numbers
+import os
+import re
+import shutil
 import tarfile
+import tempfile
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List, Sequence, Tuple
 import requests
+import urllib3
+from numba import njit
+import numpy as np
 import pandas as pd
-from pydantic import BaseModel, ConfigDict
+import pyarrow as pa
+from pyarrow import csv as pacsv
+from scipy.signal import fftconvolve
 import matplotlib.pyplot as plt
-import seaborn as sns
 
 
-class MovieDataset(BaseModel):
+# Matches the genre names (the values) in a stringified genre dictionary
+GENRE_PATTERN = re.compile(r':\s*"([^"]+)"')
+
+
+@functools.lru_cache(maxsize=4096)
+def decode_genre(escaped: str) -> str:
+    """
+    Decodes a genre name matched by GENRE_PATTERN, which is still JSON-escaped
+    (e.g. "Film \\u00e0 clef" becomes "Film à clef").
+
+    Args:
+        escaped (str): Genre name as it appears in the genre dictionary.
+
+    Returns:
+        str: The decoded genre name.
+    """
+    return json.loads(f'"{escaped}"')
+
+
+@functools.lru_cache(maxsize=4096)
+def parse_genres(raw: str) -> Tuple[str, ...]:
+    """
+    Parses a stringified genre dictionary into a tuple of decoded genre names.
+
+    Args:
+        raw (str): Genre dictionary as stored in the movie metadata.
+
+    Returns:
+        Tuple[str, ...]: Genre names in their original order.
+    """
+    return tuple(decode_genre(genre) for genre in GENRE_PATTERN.findall(raw))
+
+
+# Maximum number of heights fed to the density estimate
+MAX_KDE_SAMPLES = 5000
+
+
+@njit(cache=True)
+def linear_binning(samples, start, delta, size):
+    """
+    Splits each sample's weight between its two neighbouring grid points.
+
+    Args:
+        samples (np.ndarray): Data points inside the grid.
+        start (float): First grid point.
+        delta (float): Grid spacing.
+        size (int): Number of grid points.
+
+    Returns:
+        np.ndarray: Binned weights at each grid point.
+    """
+    counts = np.zeros(size + 1)
+    for value in samples:
+        position = (value - start) / delta
+        left = int(position)
+        weight = position - left
+        counts[left] += 1 - weight
+        counts[left + 1] += weight
+    return counts[:size]
+
+
+def fft_kde(samples: np.ndarray, grid: np.ndarray) -> np.ndarray:
+    """
+    Estimates a Gaussian KDE on an evenly spaced grid.
+
+    The samples are linearly binned onto the grid and the bin counts are
+    convolved with the kernel via FFT, so the cost grows with the grid size
+    rather than with samples x grid points. Uses Silverman's bandwidth.
+
+    Args:
+        samples (np.ndarray): Data points; values outside the grid are ignored.
+        grid (np.ndarray): Evenly spaced evaluation points.
+
+    Returns:
+        np.ndarray: Density values at each grid point.
+    """
+    samples = samples[(samples >= grid[0]) & (samples <= grid[-1])]
+    delta = grid[1] - grid[0]
+
+    counts = linear_binning(samples, grid[0], delta, grid.size)
+
+    # Silverman's rule of thumb, falling back to the std when the IQR is zero
+    std = samples.std(ddof=1)
+    iqr = np.subtract(*np.percentile(samples, [75, 25]))
+    spread = min(std, iqr / 1.34) if iqr > 0 else std
+    bandwidth = 0.9 * spread * samples.size ** -0.2
+
+    # Discretized kernel, truncated at 4 bandwidths and normalized to unit mass
+    half_width = min(int(4 * bandwidth / delta), grid.size - 1)
+    offsets = np.arange(-half_width, half_width + 1) * delta
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    kernel /= kernel.sum()
+
+    return np.clip(fftconvolve(counts, kernel, mode="same"), 0, None) / (samples.size * delta)
+
+
+def height_density(
+    heights: np.ndarray, min_height: float, max_height: float
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """
+    Estimates the density of actor heights on a 1024-point grid.
+    - Subsamples to MAX_KDE_SAMPLES heights; a few thousand give a visually identical curve.
+    - The subsample is seeded so repeated calls return the same curve.
+
+    Args:
+        heights (np.ndarray): Actor heights in meters.
+        min_height (float): Lower end of the grid.
+        max_height (float): Upper end of the grid.
+
+    Returns:
+        Optional[Tuple[np.ndarray, np.ndarray]]: Grid points and densities, or None if
+        there are fewer than two distinct heights.
+    """
+    if len(heights) > MAX_KDE_SAMPLES:
+        heights = np.random.default_rng(0).choice(heights, MAX_KDE_SAMPLES, replace=False)
+
+    # A KDE needs at least two distinct values
+    if np.unique(heights).size < 2:
+        return None
+
+    grid = np.linspace(min_height, max_height, 1024)
+    return grid, fft_kde(heights, grid)
+
+
+@njit(cache=True)
+def unique_per_group(group_codes, value_codes, n_groups, n_values):
+    """
+    Counts the distinct values in each group.
+    - Rows are counting-sorted by group, then each value is stamped with the last group
+      it was seen in, so every row is visited a constant number of times.
+
+    Args:
+        group_codes (np.ndarray): Group code of each row, from pd.factorize.
+        value_codes (np.ndarray): Value code of each row, from pd.factorize (-1 for missing).
+        n_groups (int): Number of distinct groups.
+        n_values (int): Number of distinct values.
+
+    Returns:
+        np.ndarray: Number of distinct non-missing values in each group.
+    """
+    # Offsets of each group's rows in the sorted order
+    starts = np.zeros(n_groups + 1, dtype=np.int64)
+    for group in group_codes:
+        starts[group + 1] += 1
+    for group in range(n_groups):
+        starts[group + 1] += starts[group]
+
+    positions = starts[:-1].copy()
+    rows = np.empty(group_codes.size, dtype=np.int64)
+    for row in range(group_codes.size):
+        group = group_codes[row]
+        rows[positions[group]] = row
+        positions[group] += 1
+
+    last_group = np.full(n_values, -1, dtype=np.int64)
+    counts = np.zeros(n_groups, dtype=np.int64)
+    for group in range(n_groups):
+        for position in range(starts[group], starts[group + 1]):
+            value = value_codes[rows[position]]
+            if value >= 0 and last_group[value] != group:
+                last_group[value] = group
+                counts[group] += 1
+    return counts
+
+
+@njit(cache=True)
+def _actor_count_kernel(counts):
+    """
+    Builds a histogram of per-movie actor counts in a single pass.
+
+    Args:
+        counts (np.ndarray): Number of unique actors in each movie.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The occurring actor counts in ascending order,
+        and how many movies have each of them.
+    """
+    # No movies means no histogram (counts.max() is undefined for an empty array)
+    if counts.size == 0:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+    movie_counts = np.zeros(counts.max() + 1, dtype=np.int64)
+    for count in counts:
+        movie_counts[count] += 1
+    unique_counts = np.flatnonzero(movie_counts)
+    return unique_counts, movie_counts[unique_counts]
+
+
+class MovieDataset:
     """Class to handle downloading, extracting, and loading the CMU Movie Dataset.
 
     Attributes:
         base_url (str): URL for downloading the dataset.
         dataset_filename (str): Name of the dataset archive file.
+        cache_version (int): Version tag of the Parquet cache files.
         download_dir (Path): Directory where dataset will be downloaded.
         extracted_dir (Path): Directory where dataset will be extracted.
-        dataset_path (Path): Full path to the downloaded archive.
         dataframes (Dict[str, Optional[pd.DataFrame]]): Dictionary holding all loaded DataFrames.
+        column_names (dict): Column names for each recognized dataset.
+        column_dtypes (dict): Compact dtypes applied to columns of recognized datasets.
+        text_columns (dict): Columns of recognized datasets always read as text.
+
+    Each recognized dataset is also exposed as an attribute named after it
+    (e.g. movie_metadata), which is None if it could not be loaded.
+    plot_summaries is indexed by wiki_movie_id. character_metadata has a derived
+    actor_dob_month column, which is missing for birth dates without a month.
     """
 
+    __slots__ = (
+        "download_dir", "extracted_dir", "dataframes", "movie_metadata", "character_metadata",
+        "plot_summaries", "tvtropes_clusters", "name_clusters", "_sorted_heights_cache"
+    )
+
     base_url: str = "http://www.cs.cmu.edu/~ark/personas/data/"
     dataset_filename: str = "MovieSummaries.tar.gz"
-    download_dir: Path = Path("downloads")
-    extracted_dir: Path = download_dir / "MovieSummaries"
-    dataset_path: Path = download_dir / dataset_filename
-
-    # Dictionary to store all dynamically loaded datasets
-    dataframes: Dict[str, Optional[pd.DataFrame]] = {}
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, extra="allow")
+    # Bump whenever the load-time conversions change so stale Parquet caches are rebuilt
+    cache_version: int = 5
 
-    column_names: object = {
+    column_names: Dict[str, List[str]] = {
         "movie_metadata": [
             "wiki_movie_id", "freebase_movie_id", "movie_name", "release_date",
             "box_office_revenue", "runtime", "languages", "countries", "genres"
@@ -51,61 +259,84 @@ class MovieDataset(BaseModel):
         "name_clusters": ["freebase_char_actor_map_id", "character_name"]
     }
 
-    def __init__(self):
+    # Read as text whatever they look like; load_dataset parses them knowing their precision
+    text_columns: Dict[str, List[str]] = {
+        "movie_metadata": ["release_date"],
+        "character_metadata": ["release_date", "actor_dob"]
+    }
+
+    column_dtypes: Dict[str, Dict[str, str]] = {
+        "movie_metadata": {"wiki_movie_id": "int32"},
+        "character_metadata": {
+            "wiki_movie_id": "int32", "freebase_movie_id": "category",
+            "actor_gender": "category", "actor_ethnicity": "category"
+        },
+        "plot_summaries": {"wiki_movie_id": "int32"}
+    }
+
+    def __init__(self, download_dir: Path = Path("downloads")):
         """
         Initializes the MovieDataset class.
         - Creates necessary directories.
-        - Downloads dataset if missing.
-        - Extracts dataset if needed.
-        - Dynamically loads all .tsv and .txt files into Pandas DataFrames.
+        - Downloads and extracts dataset if missing.
+        - Loads all recognized .tsv and .txt files into Pandas DataFrames.
+
+        Args:
+            download_dir (Path): Directory holding the extracted MovieSummaries corpus.
+            Default is "downloads" in the working directory.
         """
-        super().__init__()
+        self.download_dir: Path = Path(download_dir)
+        self.extracted_dir: Path = self.download_dir / "MovieSummaries"
+
+        # Dictionary to store all loaded datasets; each one is also set as an attribute
+        self.dataframes: Dict[str, Optional[pd.DataFrame]] = {}
+        for dataset_name in self.column_names:
+            self.dataframes[dataset_name] = None
+            setattr(self, dataset_name, None)
+
+        # Sorted actor heights per gender, filled on first use by actor_distributions
+        self._sorted_heights_cache: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
 
         # Ensure the download directory exists
         self.download_dir.mkdir(exist_ok=True)
 
-        # Download dataset if it does not exist
-        if not self.dataset_path.exists():
-            self.download_dataset()
-
-        # Extract dataset if it has not been extracted
+        # Download and extract dataset if it has not been extracted
         if not self.extracted_dir.exists():
-            self.extract_dataset()
+            self.fetch_and_extract()
 
         # Load all available dataset files dynamically
         self.load_all_datasets()
 
-    def download_dataset(self):
+    def fetch_and_extract(self):
         """
-        Downloads the dataset from the specified URL if it does not already exist.
+        Streams the dataset archive from the specified URL and extracts it on the fly.
+        - The archive is decompressed while it downloads and is never written to disk.
+        - Extraction goes to a temporary directory that is moved into place only once the
+        - whole archive was read, so a failed or truncated download leaves nothing behind.
         """
-        print(f"Downloading {self.dataset_filename}...")
+        print(f"Downloading and extracting {self.dataset_filename}...")
 
+        staging_dir = Path(tempfile.mkdtemp(prefix=".extract-", dir=self.download_dir))
         try:
-            response = requests.get(self.base_url + self.dataset_filename, stream=True, timeout=10)
-            response.raise_for_status()
+            with requests.get(self.base_url + self.dataset_filename, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
 
-            with open(self.dataset_path, "wb") as file:
-                for chunk in response.iter_content(chunk_size=8192):
-                    file.write(chunk)
+                # Read the stream in 1 MiB blocks instead of tarfile's default 10 KiB records.
+                # The "data" filter rejects absolute paths, links out of the target and device files.
+                with tarfile.open(fileobj=response.raw, mode="r|gz", bufsize=1 << 20) as tar:
+                    tar.extractall(path=staging_dir, filter="data")
 
-            print("Download complete.")
+            (staging_dir / self.extracted_dir.name).rename(self.extracted_dir)
+            print("Download and extraction complete.")
 
-        except requests.exceptions.RequestException as e:
+        # Reading response.raw directly raises urllib3 errors (e.g. IncompleteRead), not requests ones
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             print(f"Download failed: {e}")
-
-    def extract_dataset(self):
-        """
-        Extracts the dataset archive into the designated directory.
-        """
-        print("Extracting dataset...")
-
-        try:
-            with tarfile.open(self.dataset_path, "r:gz") as tar:
-                tar.extractall(path=self.download_dir)
-            print("Extraction complete.")
-        except tarfile.TarError as e:
+        except (tarfile.TarError, OSError, EOFError) as e:
             print(f"Error extracting dataset: {e}")
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
 
     def load_all_datasets(self):
         """
@@ -124,6 +355,9 @@ class MovieDataset(BaseModel):
     def load_dataset(self, file_path: Path):
         """
         Loads a dataset file into a Pandas DataFrame and stores it in dataframes.
+        - Files that are not one of the recognized datasets are skipped.
+        - Datasets are cached next to the source file as Parquet
+        - and read from there on subsequent loads.
 
         Args:
             file_path (Path): Path to the dataset file.
@@ -132,18 +366,191 @@ class MovieDataset(BaseModel):
 
         print(f"Checking file: {file_path}")  # Debugging line
 
-        try:
-            df = pd.read_csv(file_path, sep="\t", header=None)
+        if dataset_name not in self.column_names:
+            print(f"Skipping unrecognized file: {file_path}")
+            return
+
+        parquet_path = file_path.with_suffix(f".v{self.cache_version}.parquet")
 
-            # Apply column names if recognized
-            if dataset_name in self.column_names:
+        try:
+            # Reuse the columnar copy written by a previous load, if there is a readable one
+            df = self.read_parquet_cache(file_path, parquet_path)
+            if df is None:
+                text_columns = [
+                    self.column_names[dataset_name].index(column)
+                    for column in self.text_columns.get(dataset_name, [])
+                ]
+                df = self.read_tsv(file_path, text_columns)
+
+                # Apply column names
                 df.columns = self.column_names[dataset_name]
 
-            setattr(self, dataset_name, df)  # Dynamically set as attribute
-            print(f"Loaded dataset: {dataset_name}, Shape: {df.shape}")
+            # Give both load paths one schema and store repetitive columns compactly
+            df = self.normalize_dtypes(dataset_name, df)
+
+            # Parse numeric and date columns once so the analysis methods can use them directly
+            if dataset_name == "character_metadata":
+                df["actor_height"] = pd.to_numeric(df["actor_height"], errors="coerce")
+                if "actor_dob_month" not in df.columns:
+                    # ISO8601 parsing puts "YYYY" on January 1 and "YYYY-MM" on day 1, so keep
+                    # the month only for values that state one (already stored in Parquet)
+                    has_month = (df["actor_dob"].str.len() >= 7).fillna(False).to_numpy(dtype=bool)
+                    df["actor_dob"] = pd.to_datetime(
+                        df["actor_dob"], errors="coerce", format="ISO8601", cache=True
+                    )
+                    df["actor_dob_month"] = df["actor_dob"].dt.month.where(has_month).astype("Int8")
+            elif dataset_name == "movie_metadata":
+                df["release_date"] = pd.to_datetime(
+                    df["release_date"], errors="coerce", format="ISO8601", cache=True
+                )
+            elif dataset_name == "plot_summaries" and "wiki_movie_id" in df.columns:
+                # Index summaries by movie for hashed lookups (already indexed when read from Parquet)
+                df = df.set_index("wiki_movie_id")
+
         except Exception as e:  # pylint: disable=broad-except
             print(f"Error loading {file_path}: {e}")
+            self.dataframes[dataset_name] = None
             setattr(self, dataset_name, None)
+            return
+
+        self.dataframes[dataset_name] = df
+        setattr(self, dataset_name, df)  # Dynamically set as attribute
+        print(f"Loaded dataset: {dataset_name}, Shape: {df.shape}")
+
+        # Cache as Parquet so later loads skip the TSV parsing
+        if not parquet_path.exists():
+            self.write_parquet_cache(df, file_path, parquet_path)
+
+    def normalize_dtypes(self, dataset_name: str, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Casts a freshly read dataset to the one schema used whichever way it was loaded.
+        - Text columns become PyArrow strings; the TSV reader produces these, but Parquet
+        - reads them back as pandas' own string type.
+        - Columns in column_dtypes get their compact dtype, with PyArrow string categories.
+
+        Args:
+            dataset_name (str): Name of the recognized dataset.
+            df (pd.DataFrame): Dataset as read from the TSV or the Parquet cache.
+
+        Returns:
+            pd.DataFrame: The dataset with normalized dtypes.
+        """
+        string_dtype = pd.ArrowDtype(pa.string())
+
+        df = df.astype({
+            column: string_dtype
+            for column, dtype in df.dtypes.items()
+            if pd.api.types.is_string_dtype(dtype) and not isinstance(dtype, pd.CategoricalDtype)
+        })
+        df = df.astype({
+            column: dtype
+            for column, dtype in self.column_dtypes.get(dataset_name, {}).items()
+            if column in df.columns
+        })
+
+        # Categories built from (or read back as) another string type are relabelled in place
+        for column, dtype in df.dtypes.items():
+            if (
+                isinstance(dtype, pd.CategoricalDtype)
+                and pd.api.types.is_string_dtype(dtype.categories.dtype)
+                and dtype.categories.dtype != string_dtype
+            ):
+                df[column] = df[column].cat.rename_categories(dtype.categories.astype(string_dtype))
+
+        return df
+
+    @staticmethod
+    def read_parquet_cache(file_path: Path, parquet_path: Path) -> Optional[pd.DataFrame]:
+        """
+        Reads the Parquet cache of a dataset, memory-mapped rather than read.
+        - An unreadable cache (e.g. left truncated by a crash) is deleted, so the
+        - dataset is parsed from the TSV again and the cache rewritten.
+
+        Args:
+            file_path (Path): Path to the source dataset file.
+            parquet_path (Path): Path of the cache for the current cache_version.
+
+        Returns:
+            Optional[pd.DataFrame]: The cached dataset, or None if there is no usable cache.
+        """
+        if not parquet_path.exists():
+            return None
+        try:
+            return pd.read_parquet(parquet_path, memory_map=True)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Discarding unreadable Parquet cache of {file_path}: {e}")
+            with contextlib.suppress(OSError):
+                parquet_path.unlink(missing_ok=True)
+            return None
+
+    @staticmethod
+    def write_parquet_cache(df: pd.DataFrame, file_path: Path, parquet_path: Path):
+        """
+        Writes the Parquet cache of a loaded dataset and removes caches of older versions.
+        - The cache is written to a temporary file and renamed into place, so an
+        - interrupted write never leaves a partial cache at parquet_path.
+        - A failed write (disk full, permissions, unsupported columns) is only reported;
+        - the dataset stays loaded and the next load parses the TSV again.
+
+        Args:
+            df (pd.DataFrame): The loaded dataset.
+            file_path (Path): Path to the source dataset file.
+            parquet_path (Path): Path of the cache for the current cache_version.
+        """
+        temp_path = None
+        try:
+            # Same directory as the cache, so the rename cannot cross filesystems
+            fd, temp_name = tempfile.mkstemp(prefix=f".{parquet_path.name}.", dir=parquet_path.parent)
+            os.close(fd)
+            temp_path = Path(temp_name)
+            df.to_parquet(temp_path)
+            os.replace(temp_path, parquet_path)
+        except Exception as e:  # pylint: disable=broad-except
+            print(f"Could not cache {file_path} as Parquet: {e}")
+            # Do not leave a partial file behind
+            if temp_path is not None:
+                with contextlib.suppress(OSError):
+                    temp_path.unlink(missing_ok=True)
+            return
+
+        # Caches written under an earlier cache_version are never read again
+        for stale_path in file_path.parent.glob(f"{file_path.stem}.v*.parquet"):
+            if stale_path != parquet_path:
+                with contextlib.suppress(OSError):
+                    stale_path.unlink()
+
+    @staticmethod
+    def read_tsv(file_path: Path, text_columns: Sequence[int] = ()) -> pd.DataFrame:
+        """
+        Reads a headerless tab-separated file with PyArrow's multi-threaded CSV reader.
+        - Falls back to pd.read_csv if PyArrow cannot parse the file.
+        - Columns at the text_columns positions are always read as strings, so type
+        - inference can neither turn them into dates nor disagree between blocks.
+
+        Args:
+            file_path (Path): Path to the dataset file.
+            text_columns (Sequence[int]): Positions of the columns to read as strings.
+
+        Returns:
+            pd.DataFrame: Arrow-backed DataFrame with positional column names.
+        """
+        try:
+            table = pacsv.read_csv(
+                file_path,
+                read_options=pacsv.ReadOptions(autogenerate_column_names=True, block_size=8 << 20),
+                parse_options=pacsv.ParseOptions(delimiter="\t"),
+                convert_options=pacsv.ConvertOptions(
+                    strings_can_be_null=True,
+                    column_types={f"f{position}": pa.string() for position in text_columns}
+                )
+            )
+            df = table.to_pandas(types_mapper=pd.ArrowDtype)
+            df.columns = range(df.shape[1])
+            return df
+        except pa.ArrowInvalid:
+            return pd.read_csv(
+                file_path, sep="\t", header=None, dtype={position: str for position in text_columns}
+            )
 
     def movie_type(self, top_n: int = 10) -> pd.DataFrame:
         """
@@ -155,31 +562,44 @@ class MovieDataset(BaseModel):
         Returns:
             pd.DataFrame: DataFrame with columns "Movie_Type" and "Count".
         """
+        return pd.DataFrame(self._movie_type_soa(top_n))
+
+    def _movie_type_soa(self, top_n: int = 10) -> Dict[str, np.ndarray]:
+        """
+        Returns the N most common movie types and their counts as plain column arrays.
+        - movie_type wraps the arrays into a DataFrame.
+
+        Args:
+            top_n (int): Number of top movie types to return. Default is 10.
+
+        Returns:
+            Dict[str, np.ndarray]: Arrays "Movie_Type" and "Count" of equal length.
+        """
         if not isinstance(top_n, int):
             raise ValueError("top_n must be an integer.")
 
         if not hasattr(self, "movie_metadata") or self.movie_metadata is None:
             raise ValueError("Movie metadata is not loaded.")
 
-        # Extract genres from the last column, which is a dictionary
-        genre_series = self.movie_metadata["genres"].dropna()
+        # Extract the genre names of each movie and flatten them into one Series
+        genre_series = self.movie_metadata["genres"].dropna().str.findall(GENRE_PATTERN).explode()
 
-        # Convert each genre dictionary into a list of genres and flatten
-        genre_list = genre_series.apply(
-            lambda x: list(eval(x).values())  # Assuming it's stored as a stringified dictionary
+        # Count the occurrence of each genre, decoding each distinct name once; spellings
+        # that decode to the same name are merged before keeping the top N
+        counts = genre_series.value_counts()
+        counts.index = counts.index.map(decode_genre)
+        counts = (
+            counts.groupby(level=0, sort=False).sum()
+            .sort_values(ascending=False, kind="stable").head(top_n)
         )
-        genre_flattened = [genre for sublist in genre_list for genre in sublist]
-
-        # Count the occurrence of each genre
-        genre_counts = pd.Series(genre_flattened).value_counts()
-
-        # Create DataFrame with the top N genres
-        result_df = genre_counts.head(top_n).reset_index()
-        result_df.columns = ["Movie_Type", "Count"]
 
-        return result_df
+        # Counts are small nonnegative integers, so store them in the smallest unsigned type
+        return {
+            "Movie_Type": counts.index.to_numpy(),
+            "Count": pd.to_numeric(counts.to_numpy(), downcast="unsigned")
+        }
 
-    def actor_count(self) -> pd.DataFrame:
+    def actor_count(self, engine: str = "numba") -> pd.DataFrame:
         """
         Returns a histogram DataFrame showing the number of actors per movie vs. the movie count.
         Also, displays a histogram plot.
@@ -188,9 +608,16 @@ class MovieDataset(BaseModel):
         - "Number_of_Actors" (unique actor count per movie)
         - "Movie_Count" (number of movies with that many actors)
 
+        Args:
+            engine (str): 'numba' for the compiled kernels, 'pandas' for the groupby path.
+            Both return the same DataFrame.
+
         Returns:
             pd.DataFrame: DataFrame with columns "Number_of_Actors" and "Movie_Count".
         """
+        if engine not in ("numba", "pandas"):
+            raise ValueError("engine must be 'numba' or 'pandas'.")
+
         if not hasattr(self, "character_metadata") or self.character_metadata is None:
             raise ValueError("Character metadata is not loaded.")
 
@@ -202,27 +629,46 @@ class MovieDataset(BaseModel):
                     required_columns - set(self.character_metadata.columns)}"
             )
 
-        # Count the number of unique actors per movie
-        actor_counts = self.character_metadata.groupby("wiki_movie_id")["actor_name"].nunique()
+        # Movies without any named actor get a count of 0, as SeriesGroupBy.nunique reports them
+        if engine == "numba":
+            # Count the unique actors per movie on integer codes, then histogram the counts
+            movie_codes, movie_ids = pd.factorize(self.character_metadata["wiki_movie_id"])
+            actor_codes, actor_names = pd.factorize(self.character_metadata["actor_name"])
+            actor_counts = unique_per_group(movie_codes, actor_codes, len(movie_ids), len(actor_names))
+            number_of_actors, movie_count = _actor_count_kernel(actor_counts)
+            histogram = pd.DataFrame(
+                {"Number_of_Actors": number_of_actors, "Movie_Count": movie_count}
+            )
+        else:
+            # Deduplicating the (movie, actor) pairs and taking the group size is
+            # much faster than SeriesGroupBy.nunique (pandas #10894)
+            movie_actors = self.character_metadata[["wiki_movie_id", "actor_name"]]
+            actor_counts = (
+                movie_actors.dropna().drop_duplicates().groupby("wiki_movie_id").size()
+                .reindex(movie_actors["wiki_movie_id"].unique(), fill_value=0)
+            )
+
+            # Create a histogram DataFrame: How many movies have X number of actors?
+            histogram = actor_counts.value_counts().reset_index()
+            histogram.columns = ["Number_of_Actors", "Movie_Count"]
 
-        # Create a histogram DataFrame: How many movies have X number of actors?
-        histogram = actor_counts.value_counts().reset_index()
-        histogram.columns = ["Number_of_Actors", "Movie_Count"]
+            # Sort the results in ascending order of number of actors
+            histogram = histogram.sort_values(by="Number_of_Actors", ignore_index=True)
 
-        # Sort the results in ascending order of number of actors
-        histogram = histogram.sort_values(by="Number_of_Actors")
+        # Both columns are small nonnegative integers, so store them in the smallest unsigned type
+        histogram = histogram.apply(pd.to_numeric, downcast="unsigned")
 
         # --- PLOT THE HISTOGRAM ---
-        plt.figure(figsize=(10, 6))
-        plt.bar(histogram["Number_of_Actors"],
-                histogram["Movie_Count"],
-                color="skyblue",
-                edgecolor="black")
-        plt.xlabel("Number of Actors per Movie")
-        plt.ylabel("Movie Count")
-        plt.title("Histogram of Number of Actors per Movie")
-        plt.xticks(rotation=45)
-        plt.grid(axis="y", linestyle="--", alpha=0.7)
+        _, ax = plt.subplots(figsize=(10, 6))
+        ax.bar(histogram["Number_of_Actors"],
+               histogram["Movie_Count"],
+               color="skyblue",
+               edgecolor="black")
+        ax.set_xlabel("Number of Actors per Movie")
+        ax.set_ylabel("Movie Count")
+        ax.set_title("Histogram of Number of Actors per Movie")
+        ax.tick_params(axis="x", rotation=45)
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
 
         # Show the plot
         plt.show()
@@ -243,12 +689,15 @@ class MovieDataset(BaseModel):
             plot (bool, optional): If True, plots a histogram or density plot. Default is False.
 
         Returns:
-            pd.DataFrame: Filtered actor dataset.
+            pd.DataFrame: Filtered actor dataset, ordered by height, with heights in meters.
         """
-        # Ensure valid input types
-        if not isinstance(gender, str):
-            raise ValueError("Gender must be a string.")
-        if not isinstance(max_height, (int, float)) or not isinstance(min_height, (int, float)):
+        # Ensure valid input types with one combined check; only a failure looks at which one
+        if not (
+            isinstance(gender, str)
+            and isinstance(max_height, numbers.Real) and isinstance(min_height, numbers.Real)
+        ):
+            if not isinstance(gender, str):
+                raise ValueError("Gender must be a string.")
             raise ValueError("Height limits must be numerical values.")
 
         # Ensure the dataset is loaded
@@ -263,31 +712,20 @@ class MovieDataset(BaseModel):
                     required_columns - set(self.character_metadata.columns)}"
             )
 
-        # Convert heights to numerical, forcing errors to NaN
-        self.character_metadata["actor_height"] = pd.to_numeric(
-            self.character_metadata["actor_height"], errors="coerce"
-        )
-
-        # Drop missing height values
-        df = self.character_metadata.dropna(subset=["actor_height"]).copy()
-
-        # Standardize height units: Convert values > 10 (likely in cm) to meters
-        df.loc[df["actor_height"] > 10, "actor_height"] /= 100
-
-        # Apply gender filter
-        valid_genders = df["actor_gender"].dropna().unique().tolist() + ["All"]
-        if gender != "All":
-            if gender not in valid_genders:
-                raise ValueError(f"Invalid gender value. Must be one of: {valid_genders}")
-            df = df[df["actor_gender"] == gender]
-
-        # Apply height range filter
-        df = df[(df["actor_height"] >= min_height) & (df["actor_height"] <= max_height)]
+        # Find the height range in the cached sorted heights by binary search,
+        # then take just those rows into a new DataFrame
+        heights, positions = self._sorted_heights(gender)
+        start = np.searchsorted(heights, min_height, side="left")
+        stop = np.searchsorted(heights, max_height, side="right")
+        df = self.character_metadata.iloc[positions[start:stop]].assign(actor_height=heights[start:stop])
 
         # If plot is True, create a density plot
         if plot:
             plt.figure(figsize=(10, 6))
-            sns.kdeplot(df["actor_height"], color="blue", alpha=0.5)
+            density = height_density(df["actor_height"].to_numpy(), min_height, max_height)
+            if density is not None:
+                plt.fill_between(*density, alpha=0.5, color="blue")
+                plt.plot(*density, color="blue")
             plt.ylabel("Density")
             plt.title(f"Density Plot of Actor Heights ({gender})")
             plt.xlabel("Actor Height (m)")
@@ -296,6 +734,77 @@ class MovieDataset(BaseModel):
 
         return df
 
+    def _sorted_heights(self, gender: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the heights of the actors of a gender, sorted, with their row positions.
+        - Computed once per gender and kept in this instance's _sorted_heights_cache.
+        - Heights above 10 are taken to be in centimeters and converted to meters.
+        - Only arrays are cached; callers build their own rows from the positions.
+
+        Args:
+            gender (str): "All" or a specific gender from the dataset.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: The sorted heights in meters, and the positions
+            of the matching rows in character_metadata.
+        """
+        if gender in self._sorted_heights_cache:
+            return self._sorted_heights_cache[gender]
+
+        if gender != "All":
+            # Derive a single gender from the sorted "All" arrays; masking keeps the order
+            heights, positions = self._sorted_heights("All")
+            genders = self.character_metadata["actor_gender"].iloc[positions]
+            valid_genders = genders.dropna().unique().tolist() + ["All"]
+            if gender not in valid_genders:
+                raise ValueError(f"Invalid gender value. Must be one of: {valid_genders}")
+            keep = (genders == gender).to_numpy(dtype=bool)
+            entry = heights[keep], positions[keep]
+        else:
+            # Drop missing height values
+            heights = self.character_metadata["actor_height"].to_numpy(dtype=np.float64, na_value=np.nan)
+            positions = np.flatnonzero(~np.isnan(heights))
+
+            # Standardize height units in place on a NumPy copy: values > 10 (likely in cm) to meters
+            heights = heights[positions]
+            np.divide(heights, 100, out=heights, where=heights > 10)
+
+            # Sort once, stably so equal heights keep their original order
+            order = np.argsort(heights, kind="stable")
+            entry = heights[order], positions[order]
+
+        self._sorted_heights_cache[gender] = entry
+        return entry
+
+    @staticmethod
+    def count_per_value(
+        values: np.ndarray, column: str, index_name: str,
+        start: Optional[int] = None, stop: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        Counts how often each integer value occurs using a dense np.bincount.
+
+        Args:
+            values (np.ndarray): Float array of whole numbers; NaN entries are ignored.
+            column (str): Name of the count column.
+            index_name (str): Name of the index holding the values.
+            start (Optional[int]): First value of the index. Defaults to the smallest value.
+            stop (Optional[int]): End (exclusive) of the index. Defaults to the largest value + 1.
+
+        Returns:
+            pd.DataFrame: Counts for every value in [start, stop), including zeros.
+        """
+        values = values[~np.isnan(values)].astype(np.int64)
+        if start is None:
+            start = int(values.min()) if values.size else 0
+        if stop is None:
+            stop = int(values.max()) + 1 if values.size else start
+
+        counts = np.bincount(values - start, minlength=stop - start)
+        return pd.DataFrame(
+            {column: counts}, index=pd.RangeIndex(start, stop, name=index_name)
+        )
+
     def releases(self, genre: Optional[str] = None) -> pd.DataFrame:
         """
         Creates a DataFrame showing the number of movies released per year.
@@ -306,7 +815,7 @@ class MovieDataset(BaseModel):
 
         Returns:
             pd.DataFrame: A DataFrame with columns ["Year", "Movie_Count"]
-            - showing the number of movies released each year.
+            - showing the number of movies released each year, including years without any.
         """
         if not hasattr(self, "movie_metadata") or self.movie_metadata is None:
             raise ValueError("Movie metadata is not loaded.")
@@ -314,26 +823,20 @@ class MovieDataset(BaseModel):
         if "release_date" not in self.movie_metadata.columns or "genres" not in self.movie_metadata.columns:
             raise ValueError("Required columns (release_date, genres) are missing from the dataset.")
 
-        # Convert release_date to datetime and extract the year
-        self.movie_metadata["release_date"] = pd.to_datetime(
-            self.movie_metadata["release_date"], errors="coerce"
-        )
-        self.movie_metadata["Year"] = self.movie_metadata["release_date"].dt.year
-
-        # Drop rows with missing years
-        df = self.movie_metadata.dropna(subset=["Year"]).copy()
+        release_dates = self.movie_metadata["release_date"]
 
         # Filter by genre if specified
         if genre:
-            df = df[df["genres"].apply(
-                lambda x: genre in eval(x).values() if pd.notna(x) else False)]
-
-        # Count movies per year
-        releases_per_year = df["Year"].value_counts().sort_index().to_frame(name="Movie_Count").astype(int)
-        releases_per_year.index = releases_per_year.index.astype(int)
-        releases_per_year.index.name = "Year"
-
-        return releases_per_year
+            # Genre dictionaries are stored as '{"/m/...": "Drama", ...}', so a plain
+            # substring test on the quoted value is enough and avoids the regex engine
+            has_genre = self.movie_metadata["genres"].fillna("").str.contains(
+                f'": "{genre}"', regex=False)
+            release_dates = release_dates[has_genre]
+
+        # Count movies per year, including years without releases
+        return self.count_per_value(
+            release_dates.dt.year.to_numpy(dtype=np.float64, na_value=np.nan), "Movie_Count", "Year"
+        )
 
     def ages(self, mode: str = 'Y') -> pd.DataFrame:
         """
@@ -343,7 +846,9 @@ class MovieDataset(BaseModel):
             mode (str): 'Y' for year-based aggregation, 'M' for month-based aggregation.
 
         Returns:
-            pd.DataFrame: A DataFrame showing the count of actor births per selected mode.
+            pd.DataFrame: A DataFrame showing the count of actor births per selected mode,
+            - with every year in the range (or all twelve months) present.
+            - Birth dates given only as a year are not counted per month.
         """
         if not hasattr(self, "character_metadata") or self.character_metadata is None:
             raise ValueError("Character metadata is not loaded.")
@@ -351,27 +856,17 @@ class MovieDataset(BaseModel):
         if "actor_dob" not in self.character_metadata.columns:
             raise ValueError("Required column 'actor_dob' is missing from the dataset.")
 
-        # Convert actor_dob to datetime
-        self.character_metadata["actor_dob"] = pd.to_datetime(
-            self.character_metadata["actor_dob"], errors="coerce"
-        )
-
         # Default to Year if invalid mode is passed
         mode = mode.upper()
         if mode not in ['Y', 'M']:
             mode = 'Y'
 
         if mode == 'Y':
-            births = self.character_metadata["actor_dob"].dt.year.value_counts().sort_index().to_frame(
-                name="Birth_Count"
-            ).astype(int)
-            births.index = births.index.astype(int)
-            births.index.name = "Year"
+            years = self.character_metadata["actor_dob"].dt.year.to_numpy(dtype=np.float64, na_value=np.nan)
+            births = self.count_per_value(years, "Birth_Count", "Year")
         else:
-            births = self.character_metadata["actor_dob"].dt.month.value_counts().sort_index().to_frame(
-                name="Birth_Count"
-            ).astype(int)
-            births.index = births.index.astype(int)
-            births.index.name = "Month"
+            # Year-only birth dates carry no month, so they are left out here
+            months = self.character_metadata["actor_dob_month"].to_numpy(dtype=np.float64, na_value=np.nan)
+            births = self.count_per_value(months, "Birth_Count", "Month", start=1, stop=13)
 
         return births
@@ -1,14 +1,13 @@
 import streamlit as st
-import matplotlib.pyplot as plt
-import seaborn as sns
-from movie_dataset import MovieDataset
-
-# Create an instance of MovieDataset
-test_instance = MovieDataset()
+from matplotlib.figure import Figure
+from data import get_dataset, releases_cached, ages_cached
 
 # Set page configuration
 st.set_page_config(page_title="Chronological Trends", page_icon="📊", layout="wide")
 
+# Create an instance of MovieDataset
+test_instance = get_dataset()
+
 # Streamlit page title
 st.title("Chronological Trends")
 
@@ -17,12 +16,13 @@ genres = ["Drama", "Comedy", "Action", "Thriller", "Horror", "Romance Film", "Sc
 selected_genre = st.selectbox("Select a Genre:", [None] + genres)
 
 # Compute the release data
-releases_df = test_instance.releases(selected_genre)
+releases_df = releases_cached(test_instance, selected_genre)
 
 # Plot the results
 st.header("Movies Released Over Time")
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.bar(releases_df.index, releases_df["Movie_Count"], color="royalblue", edgecolor="black")
+fig = Figure(figsize=(10, 6))
+ax = fig.subplots()
+ax.bar(releases_df.index.to_numpy(), releases_df["Movie_Count"].to_numpy(), color="royalblue", edgecolor="black")
 ax.set_xlabel("Year")
 ax.set_ylabel("Number of Movies Released")
 ax.set_title("Movie Releases Per Year")
@@ -31,11 +31,12 @@ st.pyplot(fig)
 # Dropdown to select Year or Month for births
 st.header("Actor Births Over Time")
 birth_mode = st.selectbox("Select Aggregation Mode:", ["Year", "Month"])
-births_df = test_instance.ages("Y" if birth_mode == "Year" else "M")
+births_df = ages_cached(test_instance, "Y" if birth_mode == "Year" else "M")
 
 # Plot the births
-fig, ax = plt.subplots(figsize=(10, 6))
-ax.bar(births_df.index, births_df["Birth_Count"], color="green", edgecolor="black")
+fig = Figure(figsize=(10, 6))
+ax = fig.subplots()
+ax.bar(births_df.index.to_numpy(), births_df["Birth_Count"].to_numpy(), color="green", edgecolor="black")
 ax.set_xlabel(birth_mode)
 ax.set_ylabel("Number of Births")
 ax.set_title(f"Actor Births Per {birth_mode}")
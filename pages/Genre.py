@@ -1,66 +1,133 @@
 import streamlit as st
 import random
-import matplotlib.pyplot as plt
-from movie_dataset import MovieDataset
+import threading
+from collections import OrderedDict
+from typing import Iterator
+import plotly.graph_objects as go
+from data import get_dataset
+from movie_dataset import parse_genres
 from ollama import chat, ChatResponse
 
-# Create an instance of MovieDataset
-test_instance = MovieDataset()
-
 # Set page configuration
 st.set_page_config(page_title="Random Movie Information", page_icon="🎬", layout="wide")
 
+# Create an instance of MovieDataset
+test_instance = get_dataset()
+
+# Local model used for genre classification
+LLM_MODEL = 'mistral'
+
+# Number of LLM classifications kept; the least recently used one is dropped beyond this
+MAX_CACHED_CLASSIFICATIONS = 256
+
+@st.cache_resource
+def classification_cache():
+    """
+    Returns the LLM classifications keyed by (model, prompt), shared by all sessions,
+    in least-recently-used order, together with the lock that guards them.
+    """
+    return OrderedDict(), threading.Lock()
+
+def get_cached_classification(key):
+    """
+    Returns the cached classification for a key, or None, and marks it as recently used.
+    """
+    cache, lock = classification_cache()
+    with lock:
+        if key not in cache:
+            return None
+        cache.move_to_end(key)
+        return cache[key]
+
+def store_classification(key, value):
+    """
+    Caches a classification, evicting the least recently used ones beyond the limit.
+    """
+    cache, lock = classification_cache()
+    with lock:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > MAX_CACHED_CLASSIFICATIONS:
+            cache.popitem(last=False)
+
 # Streamlit page title
 st.title("Random Movie Information")
 
+@st.cache_resource
+def get_valid_movies(_dataset):
+    """
+    Returns the movies that have both a plot summary and genres, built once and shared read-only.
+    """
+    movie_metadata = _dataset.movie_metadata
+    return movie_metadata[
+        movie_metadata["wiki_movie_id"].isin(_dataset.plot_summaries.index) & movie_metadata["genres"].notna()
+    ].reset_index(drop=True)
+
+@st.cache_data(show_spinner=False)
+def normalize_genres(raw):
+    """
+    Parses a stringified genre dictionary into a set of lower-cased genre names.
+    """
+    return frozenset(genre.strip().lower() for genre in parse_genres(raw))
+
 # Filter movies with existing summaries and genres
-valid_movies = test_instance.movie_metadata[
-    (test_instance.movie_metadata["wiki_movie_id"].isin(test_instance.plot_summaries["wiki_movie_id"])) &
-    (test_instance.movie_metadata["genres"].notna())
-]
+valid_movies = get_valid_movies(test_instance)
+valid_movie_count = len(valid_movies)
 
 # Shuffle button
 if st.button("Shuffle"):
     # Ensure there are valid movies to choose from
-    if valid_movies.empty:
+    if valid_movie_count == 0:
         st.error("No movies with summaries and genres available.")
     else:
         # Select a random movie from the filtered list
-        random_index = random.randint(0, len(valid_movies) - 1)
+        random_index = random.randrange(valid_movie_count)
         movie = valid_movies.iloc[random_index]
         movie_id = movie["wiki_movie_id"]
         
         # Get the movie title and summary
         movie_title = movie["movie_name"]
-        plot_summary_row = test_instance.plot_summaries[test_instance.plot_summaries["wiki_movie_id"] == movie_id]
-        
-        if not plot_summary_row.empty:
-            movie_summary = plot_summary_row["plot_summary"].values[0]
-        else:
+        try:
+            movie_summary = test_instance.plot_summaries.at[movie_id, "plot_summary"]
+        except KeyError:
             movie_summary = "Summary not available."
         
         # Get the movie genres
-        movie_genres = eval(movie["genres"]).values()
+        movie_genres = parse_genres(movie["genres"])
         
         # Display the information in text boxes
         st.markdown(f"### {movie_title}\n\n{movie_summary}")
         st.text_area("Genres", ", ".join(movie_genres))
         
-        # Use local LLM to classify the genre
-        response: ChatResponse = chat(model='mistral', messages=[
-            {
-                'role': 'user',
-                'content': f'Classify the following movie summary into genres: {movie_summary}. Only list the genres, separated by commas. Do not include any additional information or brackets.',
-            },
-        ])
+        # Use local LLM to classify the genre, reusing earlier answers for the same prompt
+        prompt = f'Classify the following movie summary into genres: {movie_summary}. Only list the genres, separated by commas. Do not include any additional information or brackets.'
+        cache_key = (LLM_MODEL, prompt)
+        placeholder = st.empty()
+        llm_genres = get_cached_classification(cache_key)
+        
+        if llm_genres is None:
+            stream: Iterator[ChatResponse] = chat(model=LLM_MODEL, stream=True, messages=[
+                {
+                    'role': 'user',
+                    'content': prompt,
+                },
+            ])
+            
+            # Show the genre classification as it streams in
+            llm_genres = ""
+            for chunk in stream:
+                llm_genres += chunk.message.content
+                placeholder.markdown(f"**Genre by LLM:** {llm_genres}")
+            
+            llm_genres = llm_genres.strip()
+            store_classification(cache_key, llm_genres)
         
-        # Extract and display the genre classification
-        llm_genres = response.message.content.strip()
-        st.text_area("Genre by LLM", llm_genres)
+        # Replace the streamed text with the final classification
+        placeholder.text_area("Genre by LLM", llm_genres)
         
         # Normalize and compare genres
         identified_genres = set([genre.strip().lower() for genre in llm_genres.split(",")])
-        database_genres = set([genre.strip().lower() for genre in movie_genres])
+        database_genres = normalize_genres(movie["genres"])
         
         matching_genres = identified_genres.intersection(database_genres)
         
@@ -80,8 +147,9 @@ if st.button("Shuffle"):
             "Matching Genres": len(matching_genres)
         }
         
-        fig, ax = plt.subplots()
-        ax.bar(genre_counts.keys(), genre_counts.values(), color=["skyblue", "lightcoral", "lightgreen"])
-        ax.set_ylabel("Count")
-        ax.set_title("Genre Detection Score")
-        st.pyplot(fig)
\ No newline at end of file
+        fig = go.Figure(go.Bar(
+            x=list(genre_counts.keys()), y=list(genre_counts.values()),
+            marker_color=["skyblue", "lightcoral", "lightgreen"]
+        ))
+        fig.update_layout(title="Genre Detection Score", yaxis_title="Count")
+        st.plotly_chart(fig)
\ No newline at end of file
@@ -0,0 +1,59 @@
+from pathlib import Path
+import shutil
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal
+from movie_dataset import MovieDataset, linear_binning, unique_per_group, _actor_count_kernel
+
+# Expected results of the analysis methods on the fixture corpus, rewritten with pytest --update-golden
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+# Small checked-in corpus in the CMU format, so the golden results do not depend on a download
+FIXTURE_CORPUS_DIR = Path(__file__).parent / "fixture_corpus"
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_jit_kernels():
+    # Call each numba kernel once on a tiny input with the argument types the dataset uses,
+    # so compiling (or loading the on-disk cache) is not timed as part of the first test
+    codes = np.zeros(1, dtype=np.intp)
+    linear_binning(np.zeros(1), 0.0, 1.0, 2)
+    unique_per_group(codes, codes, 1, 1)
+    _actor_count_kernel(np.zeros(1, dtype=np.int64))
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--update-golden", action="store_true",
+        help="Rewrite the golden Parquet snapshots from the current results."
+    )
+
+@pytest.fixture(scope="session")
+def dataset():
+    # Loading the dataset is the slowest step, so build it once per session (per xdist worker).
+    # The tests only read from it.
+    return MovieDataset()
+
+@pytest.fixture(scope="session")
+def fixture_dataset(tmp_path_factory):
+    # Load a copy of the fixture corpus, so the Parquet caches are not written into the repository
+    download_dir = tmp_path_factory.mktemp("fixture_corpus")
+    shutil.copytree(FIXTURE_CORPUS_DIR, download_dir, dirs_exist_ok=True)
+    return MovieDataset(download_dir)
+
+@pytest.fixture(scope="session")
+def golden(request):
+    # Compares a result with its golden snapshot, or rewrites the snapshot with --update-golden.
+    # Dtypes are not compared, so downcasts and kernel swaps only fail on changed values.
+    update = request.config.getoption("--update-golden")
+
+    def check(name, result):
+        path = GOLDEN_DIR / f"{name}.parquet"
+        if update:
+            GOLDEN_DIR.mkdir(exist_ok=True)
+            result.to_parquet(path)
+        elif not path.exists():
+            pytest.fail(f"No golden snapshot {path.name}; run pytest --update-golden to create it.")
+        else:
+            assert_frame_equal(result, pd.read_parquet(path), check_dtype=False, check_like=True)
+
+    return check
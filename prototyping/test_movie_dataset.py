@@ -1,31 +1,94 @@
 import pytest
+import numpy as np
 import pandas as pd
-from movie_dataset import MovieDataset
+from pandas.testing import assert_frame_equal
+from movie_dataset import MovieDataset, parse_genres
 
-@pytest.fixture
-def dataset():
-    return MovieDataset()
+_EXPECTED_MOVIE_TYPE_COLS = frozenset({'Movie_Type', 'Count'})
+_EXPECTED_ACTOR_COUNT_COLS = frozenset({'Number_of_Actors', 'Movie_Count'})
 
-def test_movie_type(dataset):
-    with pytest.raises(Exception):
+def test_movie_type_bad_argument(dataset):
+    with pytest.raises(ValueError, match="top_n must be an integer"):
         dataset.movie_type("ten")
+
+def test_movie_type(dataset):
+    result = dataset._movie_type_soa(10)
+    assert _EXPECTED_MOVIE_TYPE_COLS.issubset(result)
+    assert len(result['Movie_Type']) == len(result['Count']) <= 10
+    assert result['Count'].dtype.kind == 'u'
+
+def test_movie_type_frame(dataset):
     result = dataset.movie_type(10)
-    assert isinstance(result, pd.DataFrame)
-    assert 'Movie_Type' in result.columns
-    assert 'Count' in result.columns
+    assert type(result) is pd.DataFrame
+    assert list(result.columns) == ['Movie_Type', 'Count']
+    assert 0 < len(result) <= 10
+    assert result['Count'].is_monotonic_decreasing
+    assert_frame_equal(result, pd.DataFrame(dataset._movie_type_soa(10)))
+
+def test_movie_type_decodes_genres():
+    # Genre names are JSON-escaped in the metadata; both spellings are the same genre
+    movies = MovieDataset.__new__(MovieDataset)
+    movies.movie_metadata = pd.DataFrame({"genres": [
+        '{"/m/1": "Film \\u00e0 clef", "/m/2": "Drama"}', '{"/m/1": "Film à clef"}', '{}', None
+    ]})
+    assert parse_genres(movies.movie_metadata.at[0, "genres"]) == ("Film à clef", "Drama")
+    result = movies._movie_type_soa(10)
+    assert list(result['Movie_Type']) == ["Film à clef", "Drama"]
+    assert list(result['Count']) == [2, 1]
 
 def test_actor_count(dataset):
     result = dataset.actor_count()
-    assert isinstance(result, pd.DataFrame)
-    assert 'Number_of_Actors' in result.columns
-    assert 'Movie_Count' in result.columns
+    assert type(result) is pd.DataFrame
+    assert _EXPECTED_ACTOR_COUNT_COLS.issubset(result.columns)
+    assert result['Number_of_Actors'].dtype.kind == 'u'
+    assert result['Movie_Count'].dtype.kind == 'u'
+
+@pytest.mark.parametrize("rows", [slice(None), slice(0)], ids=["all", "empty"])
+def test_actor_count_engines_agree(dataset, rows):
+    # A bare instance skips the download and load; actor_count only needs the characters
+    subset = MovieDataset.__new__(MovieDataset)
+    subset.character_metadata = dataset.character_metadata.iloc[rows]
+    assert_frame_equal(subset.actor_count(engine="pandas"), subset.actor_count(engine="numba"))
+
+@pytest.mark.parametrize("args, message", [
+    ((123, 180, 160), "Gender must be a string"),
+    (("Male", "tall", 160), "Height limits must be numerical"),
+    (("Male", 180, "short"), "Height limits must be numerical"),
+])
+def test_actor_distributions_bad_arguments(dataset, args, message):
+    with pytest.raises(ValueError, match=message):
+        dataset.actor_distributions(*args)
 
 def test_actor_distributions(dataset):
-    with pytest.raises(Exception):
-        dataset.actor_distributions(123, 180, 160)
-    with pytest.raises(Exception):
-        dataset.actor_distributions("Male", "tall", 160)
-    with pytest.raises(Exception):
-        dataset.actor_distributions("Male", 180, "short")
     result = dataset.actor_distributions("All", 180, 160)
-    assert isinstance(result, pd.DataFrame)
\ No newline at end of file
+    assert type(result) is pd.DataFrame
+
+@pytest.mark.parametrize("gender", ["All", "M", "F"])
+@pytest.mark.parametrize("max_height, min_height", [(2.0, 1.5), (1.5, 2.0)])
+def test_sorted_heights(dataset, gender, max_height, min_height):
+    heights, positions = dataset._sorted_heights(gender)
+    assert (np.diff(heights) >= 0).all()
+
+    # Brute-force filter over the raw rows, heights above 10 being in centimeters
+    characters = dataset.character_metadata
+    raw = characters["actor_height"].to_numpy(dtype=np.float64, na_value=np.nan)
+    raw = np.where(raw > 10, raw / 100, raw)
+    np.testing.assert_array_equal(heights, raw[positions])
+    matches = (raw >= min_height) & (raw <= max_height)
+    if gender != "All":
+        matches &= (characters["actor_gender"] == gender).to_numpy(dtype=bool)
+
+    # The binary search actor_distributions runs selects exactly those rows
+    start = np.searchsorted(heights, min_height, side="left")
+    stop = np.searchsorted(heights, max_height, side="right")
+    assert max(stop - start, 0) == matches.sum()
+
+@pytest.mark.parametrize("name, method, args", [
+    ("movie_type_10", "movie_type", (10,)),
+    ("actor_count", "actor_count", ()),
+    ("releases_mystery", "releases", ("Mystery",)),
+    ("ages_year", "ages", ("Y",)),
+    ("ages_month", "ages", ("M",)),
+])
+def test_matches_golden(fixture_dataset, golden, name, method, args):
+    golden(name, getattr(fixture_dataset, method)(*args))